@@ -1,6 +1,12 @@
+import mmap
+import os
+import struct
+import weakref
 import numpy as np
-import soundfile as sf
+from collections import OrderedDict
 from contextlib import contextmanager
+from functools import lru_cache
+from numpy.lib.stride_tricks import as_strided
 from pathlib import Path
 from .sndinfo import SndInfo, _create_sndinfo
 from .snd import BaseSnd
@@ -45,18 +51,54 @@ audiofloat_to_PCM_factor = {
 
 PCM_32_to_audiofloat_factor = {
     'PCM_32': 1 / 0x80000000, # 1 / 2147483648
-    'PCM_24': 1 / 0x800000, # 1 / 8388607
-    'PCM_16': 1 / 0x8000, # 1 / 32767
-    'PCM_S8': 1 / 0x80, # 1 / 127
+    'PCM_24': 1 / 0x800000, # 1 / 8388608
+    'PCM_16': 1 / 0x8000, # 1 / 32768
+    'PCM_S8': 1 / 0x80, # 1 / 128
     'PCM_U8': 1 / 0xFF, # 1 / 255
 }
 
-_sfformats = sf.available_formats()
-_sfsubtypes = sf.available_subtypes()
-_audioformatkeys = sorted(list(_sfformats.keys()))
-_audioencodingkeys = sorted(list(_sfsubtypes.keys()))
-availableaudioformats = {key: _sfformats[key] for key in _audioformatkeys}
-availableaudioencodings = {key: _sfsubtypes[key] for key in _audioencodingkeys}
+# soundfile, and thereby libsndfile, is imported when it is first needed,
+# rather than when this module is imported. Likewise, the audio formats and
+# encodings that libsndfile supports are determined on first access of the
+# module attributes `availableaudioformats` and `availableaudioencodings`.
+
+@lru_cache(maxsize=None)
+def _availableaudioformats():
+    import soundfile as sf
+    return dict(sorted(sf.available_formats().items()))
+
+@lru_cache(maxsize=None)
+def _availableaudioencodings():
+    import soundfile as sf
+    return dict(sorted(sf.available_subtypes().items()))
+
+@lru_cache(maxsize=None)
+def _suffixkinds():
+    """Returns a dictionary that maps lower and upper case file suffixes,
+    including the dot, to 'audio' for the available audio formats and to
+    'info' for sndinfo files."""
+    kinds = {}
+    for key in _availableaudioformats():
+        kinds[f'.{key.lower()}'] = 'audio'
+        kinds[f'.{key.upper()}'] = 'audio'
+    kinds[SndInfo._suffix] = 'info'
+    kinds[SndInfo._suffix.upper()] = 'info'
+    return kinds
+
+def _suffixkind(suffix):
+    """Returns 'audio', 'info' or None for a file suffix."""
+    kinds = _suffixkinds()
+    kind = kinds.get(suffix)
+    if kind is None and kinds.get(suffix.upper()) == 'audio':
+        kind = 'audio' # mixed case audio suffixes, such as '.Wav'
+    return kind
+
+def __getattr__(name):
+    if name == 'availableaudioformats':
+        return _availableaudioformats()
+    elif name == 'availableaudioencodings':
+        return _availableaudioencodings()
+    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
 
 # The choices for default dtypes for the different encodings is based on how
 # the data is read in libsndfile most directly. I figured this out by looking
@@ -98,6 +140,264 @@ encodingtodtype = {'ALAC_16': 'int16',
                    'VORBIS': 'float32',
                    'VOX_ADPCM': 'int16'}
 
+# Reading frames outside of an `open` context uses file handles that are
+# kept open in a least-recently-used cache, so that reading successive blocks
+# does not open the file and parse its header each time. Handles are keyed
+# on path and access mode, as well as on size and modification time of the
+# file, so that a handle to a file that has since been rewritten is not
+# reused.
+maxcachedfilehandles = 32
+_filehandlecache = OrderedDict()
+# The frame position of file handles after the last read is tracked here, so
+# that we do not have to ask libsndfile for it before every read. This is
+# per handle rather than per AudioFile, because cached handles can be shared
+# by different AudioFile objects of the same file.
+_fileobjpositions = weakref.WeakKeyDictionary()
+
+def _get_cachedfilehandle(path, mode, stat):
+    key = (path, mode, stat.st_size, stat.st_mtime_ns)
+    fileobj = _filehandlecache.get(key)
+    if fileobj is None or fileobj.closed:
+        import soundfile as sf
+        fileobj = sf.SoundFile(path, mode=mode)
+        _fileobjpositions[fileobj] = 0 # newly opened files are at the start
+        _filehandlecache[key] = fileobj
+        while len(_filehandlecache) > maxcachedfilehandles:
+            _, lrufileobj = _filehandlecache.popitem(last=False)
+            lrufileobj.close()
+    else:
+        _filehandlecache.move_to_end(key)
+    return fileobj
+
+def close_cachedfilehandles():
+    """Close all audio file handles that are kept open for reading."""
+    while _filehandlecache:
+        _, fileobj = _filehandlecache.popitem()
+        fileobj.close()
+
+
+# Frames in WAV files with these encodings are stored in a way that can be
+# memory-mapped directly as a numpy array with the dtype that `read_frames`
+# returns, so that no decoding by libsndfile, nor copying, is necessary.
+# PCM_24 is an exception, see `AudioFile._get_mmap`, and so are the 8-bit
+# encodings, which are decoded with `_bytetables`.
+_mmapdtypes = {'ALAW': 'u1',
+               'PCM_U8': 'u1',
+               'PCM_16': '<i2',
+               'PCM_24': '<i4',
+               'PCM_32': '<i4',
+               'FLOAT': '<f4',
+               'DOUBLE': '<f8',
+               'ULAW': 'u1'}
+
+# AIFF files are big-endian. Their memory-mapped frames are byte-swapped in
+# one vectorized numpy cast on little-endian machines, which is faster than
+# decoding by libsndfile.
+_aiffmmapdtypes = {'PCM_16': '>i2',
+                   'PCM_24': '>i4',
+                   'PCM_32': '>i4'}
+
+# Normalization factors of integer frames, which are identical to the ones
+# that libsndfile uses when it reads integer encodings as float.
+_normalizationfactors = {'int16': 1 / 0x8000,
+                         'int32': 1 / 0x80000000}
+
+# Memory-mapped little-endian PCM_24 data needs masking with this to obtain
+# int32 frames, see `AudioFile._get_mmap`.
+_pcm24mask = np.int32(-256) # 0xFFFFFF00
+
+# Encodings with int32 frames whose samples have no more than 24 significant
+# bits, so that they can be normalized to float32 without loss.
+_float32exactencodings = frozenset(('ALAC_20', 'ALAC_24', 'DWVW_24',
+                                    'PCM_24'))
+
+# Lookup tables for decoding G.711 mu-law and A-law bytes to int16, which are
+# identical to the ones that libsndfile uses. Memory-mapped ULAW and ALAW
+# frames are decoded by indexing these tables with the bytes.
+def _make_ulawtable():
+    u = ~np.arange(256) & 0xFF
+    exponent = (u >> 4) & 0x07
+    mantissa = u & 0x0F
+    magnitude = (((mantissa << 3) + 0x84) << exponent) - 0x84
+    return np.where(u & 0x80, -magnitude, magnitude).astype(np.int16)
+
+def _make_alawtable():
+    a = np.arange(256) ^ 0x55
+    exponent = (a >> 4) & 0x07
+    mantissa = a & 0x0F
+    magnitude = np.where(exponent == 0, (mantissa << 4) + 8,
+                         ((mantissa << 4) + 0x108) <<
+                         np.maximum(exponent - 1, 0))
+    return np.where(a & 0x80, magnitude, -magnitude).astype(np.int16)
+
+_ulawtable = _make_ulawtable()
+_alawtable = _make_alawtable()
+# unsigned 8-bit PCM, which libsndfile reads as int16 (x - 128) << 8
+_pcmu8table = ((np.arange(256) - 128) << 8).astype(np.int16)
+# 8-bit encodings whose memory-mapped frames are decoded by table lookup
+_bytetables = {'ALAW': _alawtable,
+               'PCM_U8': _pcmu8table,
+               'ULAW': _ulawtable}
+
+# Number of samples in the tiles in which memory-mapped PCM_24 frames are
+# normalized.
+_tilesamples = 65536
+
+# (format code, bits per sample) in the fmt chunk of a WAV file to libsndfile
+# encoding name, for the encodings that we can handle without libsndfile.
+_wavencodings = {(1, 8): 'PCM_U8',
+                 (1, 16): 'PCM_16',
+                 (1, 24): 'PCM_24',
+                 (1, 32): 'PCM_32',
+                 (3, 32): 'FLOAT',
+                 (3, 64): 'DOUBLE',
+                 (6, 8): 'ALAW',
+                 (7, 8): 'ULAW'}
+
+# trailing 14 bytes of the KSDATAFORMAT_SUBTYPE GUIDs in WAVE_FORMAT_EXTENSIBLE
+_wavexguidtail = b'\x00\x00\x00\x00\x10\x00\x80\x00\x00\xaa\x00\x38\x9b\x71'
+
+# precompiled layouts of the fixed-offset header fields that we read
+_wavchunkheader = struct.Struct('<4sI') # chunk id, chunk size
+_wavfmt = struct.Struct('<HHIIHH') # format code, channels, rate, byte rate,
+                                   # block align, bits per sample
+_wavexformatcode = struct.Struct('<H') # at offset 24 in an extensible fmt
+_aiffchunkheader = struct.Struct('>4sI') # chunk id, chunk size
+_aiffssndheader = struct.Struct('>II') # offset, block size
+
+def _read_wavheader(path, filesize):
+    """Parses the header of a plain PCM or floating point RIFF WAVE file.
+
+    This is much cheaper than opening the file with libsndfile. Returns a
+    dictionary with 'nframes', 'nchannels', 'fs', 'fileformat', 'encoding',
+    'endianness' and 'dataoffset', or None if the file is not a RIFF WAVE
+    file that we can interpret, in which case libsndfile should be used.
+
+    """
+    with open(path, 'rb') as f:
+        header = f.read(12)
+        if len(header) < 12 or header[:4] != b'RIFF' or \
+                header[8:] != b'WAVE':
+            return None
+        fmt = None
+        while True:
+            chunkheader = f.read(8)
+            if len(chunkheader) < 8:
+                return None
+            chunkid, chunksize = _wavchunkheader.unpack(chunkheader)
+            if chunkid == b'fmt ':
+                fmt = f.read(chunksize)
+                if len(fmt) < min(chunksize, 16):
+                    return None
+                if chunksize & 1:
+                    f.seek(1, 1) # chunks are word-aligned
+            elif chunkid == b'data':
+                dataoffset = f.tell()
+                datasize = chunksize
+                break
+            else:
+                f.seek(chunksize + (chunksize & 1), 1) # chunks are word-aligned
+    if fmt is None or len(fmt) < 16:
+        return None
+    formatcode, nchannels, fs, _, blockalign, bitspersample = \
+        _wavfmt.unpack_from(fmt)
+    fileformat = 'WAV'
+    if formatcode == 0xFFFE: # WAVE_FORMAT_EXTENSIBLE
+        if len(fmt) < 40 or fmt[26:40] != _wavexguidtail:
+            return None
+        formatcode, = _wavexformatcode.unpack_from(fmt, 24)
+        fileformat = 'WAVEX'
+    encoding = _wavencodings.get((formatcode, bitspersample))
+    if encoding is None or nchannels == 0 or \
+            blockalign != nchannels * bitspersample // 8 or \
+            dataoffset + datasize > filesize:
+        return None
+    return {'nframes': datasize // blockalign,
+            'nchannels': nchannels,
+            'fs': fs,
+            'fileformat': fileformat,
+            'encoding': encoding,
+            'endianness': 'FILE',
+            'dataoffset': dataoffset}
+
+def _aiff_dataoffset(path):
+    """Returns the byte offset of the sample data in an AIFF file, or None
+    if the file is not an AIFF file or if there is no sound data chunk."""
+    with open(path, 'rb') as f:
+        header = f.read(12)
+        if len(header) < 12 or header[:4] != b'FORM' or \
+                header[8:] != b'AIFF':
+            return None
+        while True:
+            chunkheader = f.read(8)
+            if len(chunkheader) < 8:
+                return None
+            chunkid, chunksize = _aiffchunkheader.unpack(chunkheader)
+            if chunkid == b'SSND':
+                ssndheader = f.read(8)
+                if len(ssndheader) < 8:
+                    return None
+                offset, _ = _aiffssndheader.unpack(ssndheader)
+                return f.tell() + offset
+            f.seek(chunksize + (chunksize & 1), 1) # chunks are word-aligned
+
+
+_accesspatternadvice = {'sequential': 'MADV_SEQUENTIAL',
+                        'random': 'MADV_RANDOM'}
+
+
+def _memmap(path, dtype, offset, shape, accesspattern=None):
+    """Returns a read-only memory map of audio frames in a file.
+
+    If `accesspattern` is 'sequential' or 'random', the kernel is advised
+    accordingly about how the frames will be read, where the platform supports
+    this. If it is None, no advice is given.
+
+    """
+    frames = np.memmap(path, dtype=dtype, mode='r', offset=offset,
+                       shape=shape)
+    if accesspattern is not None:
+        advice = getattr(mmap, _accesspatternadvice[accesspattern], None)
+        mm = getattr(frames, '_mmap', None)
+        if mm is not None and advice is not None:
+            mm.madvise(advice)
+    return frames
+
+
+def _sfheader(fileobj):
+    """Returns the header information of an open soundfile.SoundFile object,
+    in the same format as `_read_wavheader`, but without 'dataoffset'."""
+    return {'nframes': len(fileobj),
+            'nchannels': fileobj.channels,
+            'fs': fileobj.samplerate,
+            'fileformat': fileobj.format,
+            'encoding': fileobj.subtype,
+            'endianness': fileobj.endian}
+
+# Audio file headers are cached on path, size and modification time, so
+# that creating objects for the same, unchanged, file again (e.g. in
+# repeated directory scans) does not require parsing its header again.
+@lru_cache(maxsize=4096)
+def _read_header(path, filesize, mtime_ns):
+    """Returns the header information of an audio file, in the format of
+    `_read_wavheader`. 'dataoffset' is only present for files with frames
+    that may be memory-mapped. `mtime_ns` is only used as part of the cache
+    key."""
+    if os.path.splitext(path)[1].upper() in ('.WAV', '.WAVEX'):
+        header = _read_wavheader(path, filesize)
+        if header is not None:
+            return header
+    import soundfile as sf
+    with sf.SoundFile(path) as f:
+        header = _sfheader(f)
+    if header['fileformat'] == 'AIFF' and \
+            header['encoding'] in _aiffmmapdtypes:
+        dataoffset = _aiff_dataoffset(path)
+        if dataoffset is not None:
+            header['dataoffset'] = dataoffset
+    return header
+
+
 class AudioFile(BaseSnd, SndInfo):
 
     """Sound data stored in an audio file.
@@ -121,6 +421,18 @@ class AudioFile(BaseSnd, SndInfo):
     accessmode
     scalingfactor
     unit
+    keepopen: bool, default: False
+        Open a file handle at instantiation and keep it open, so that
+        subsequent reads do not have to open the file again. Use the `close`
+        method to close it.
+    stat: {None, os.stat_result}, default: None
+        Result of `os.stat` on the audio file, if it is already available,
+        so that it does not have to be obtained again. See `from_direntry`.
+    accesspattern: {None, 'sequential', 'random'}, default: None
+        How frames will mostly be read when the file is memory-mapped. With
+        'sequential' the kernel is advised to read ahead aggressively, with
+        'random' to not read ahead at all. None gives no advice, which is
+        usually best for mixed access.
 
 
     """
@@ -130,28 +442,166 @@ class AudioFile(BaseSnd, SndInfo):
     _settableparams = ('fs', 'metadata', 'origintime', 'scalingfactor',
                        'startdatetime', 'unit')
 
-    def __init__(self, path, accessmode='r'):
+    def __init__(self, path, accessmode='r', keepopen=False, stat=None,
+                 accesspattern=None):
+        if accesspattern is not None and \
+                accesspattern not in _accesspatternadvice:
+            raise ValueError(f"'accesspattern' must be None, 'sequential' or "
+                             f"'random', not '{accesspattern}'")
+        self._accesspattern = accesspattern
         audiofilepath, sndinfopath = self._check_path(path)
         self._audiofilepath = audiofilepath
+        self._audiofilepathstr = str(audiofilepath)
+        self._stat = os.stat(audiofilepath) if stat is None else stat
         self._mode = accessmode
-        with sf.SoundFile(str(path)) as f:
-            nframes = len(f)
-            nchannels = f.channels
-            fs = f.samplerate
-            self._audiofileformat = f.format
-            self._audioencoding = f.subtype
-            self._framesdtype = encodingtodtype.get(f.subtype, 'float64') # if we do not know, we just play safe
-            self._endianness = f.endian
+        if accessmode == 'r+':
+            # the file may be changed through this object, so we do not use,
+            # nor fill, the header cache
+            header = _read_header.__wrapped__(self._audiofilepathstr,
+                                              self._stat.st_size,
+                                              self._stat.st_mtime_ns)
+        else:
+            header = _read_header(self._audiofilepathstr, self._stat.st_size,
+                                  self._stat.st_mtime_ns)
+        f = None
+        if keepopen:
+            import soundfile as sf
+            f = sf.SoundFile(self._audiofilepathstr, mode=accessmode)
+        nframes = header['nframes']
+        nchannels = header['nchannels']
+        fs = header['fs']
+        self._audiofileformat = header['fileformat']
+        self._audioencoding = header['encoding']
+        self._framesdtype = encodingtodtype.get(self._audioencoding, 'float64') # if we do not know, we just play safe
+        # resolved once here, rather than on every read
+        self._npframesdtype = np.dtype(self._framesdtype)
+        self._normalizationfactor = \
+            _normalizationfactors.get(self._framesdtype)
+        # float32 represents samples of up to 24 bits exactly, and takes half
+        # the memory and bandwidth of float64
+        if self._framesdtype == 'int16' or \
+                self._audioencoding in _float32exactencodings:
+            self._normdtype = np.dtype('float32')
+        else:
+            self._normdtype = np.dtype('float64')
+        self._endianness = header['endianness']
         SndInfo.__init__(self, path=sndinfopath, accessmode=accessmode,
                          settableparams=self._settableparams)
         si = self._sndinfo._read()
-        kwargs = {sp: si.get(sp, None) for sp in self._settableparams}
-        if 'fs' in kwargs:
-            fs = kwargs['fs']
-            del kwargs['fs']
+        # parameters in sndinfo, if present, override those of audio file
+        kwargs = {sp: si[sp] for sp in self._settableparams
+                  if si.get(sp) is not None}
+        fs = kwargs.pop('fs', fs)
         BaseSnd.__init__(self, nframes=nframes, nchannels=nchannels, fs=fs,
                          setparamcallback=self._set_parameter, **kwargs)
-        self._fileobj = None
+        self._fileobj = f if keepopen else None
+        if keepopen:
+            _fileobjpositions[f] = 0
+        self._infocache = None
+        self._mmap = None
+        self._rawmmap = None
+        self._mmapoffset = None
+        self._mmapdtype = None
+        if self._audiofileformat == 'AIFF':
+            mmapdtypes = _aiffmmapdtypes
+        else:
+            mmapdtypes = _mmapdtypes
+        if nframes > 0 and 'dataoffset' in header and \
+                self._audioencoding in mmapdtypes:
+            mmapdtype = np.dtype(mmapdtypes[self._audioencoding])
+            offset = header['dataoffset']
+            samplewidth = 3 if self._audioencoding == 'PCM_24' \
+                else mmapdtype.itemsize
+            if offset + nframes * nchannels * samplewidth <= self.filesize:
+                self._mmapoffset = offset
+                self._mmapdtype = mmapdtype
+        # whether memory-mapped frames can be returned as they are
+        self._mmapisview = self._mmapdtype is not None and \
+                           self._mmapdtype == self._npframesdtype and \
+                           self._audioencoding != 'PCM_24'
+
+    @classmethod
+    def from_paths(cls, paths, accessmode='r', workers=8):
+        """Create AudioFile objects for a sequence of paths.
+
+        Audio file headers are read concurrently in a pool of threads, which
+        is much faster than creating the objects one by one when there are
+        many files, especially on network file systems, because most time is
+        spent waiting for I/O.
+
+        Parameters
+        ----------
+        paths: sequence of str, pathlib.Path or os.DirEntry
+            DirEntry objects, e.g. from `os.scandir`, are created with
+            `from_direntry`.
+        accessmode: {'r', 'r+'}, default: 'r'
+        workers: int, default: 8
+            Maximum number of threads.
+
+        Returns
+        -------
+        list of AudioFile objects, in the order of `paths`
+
+        """
+        from concurrent.futures import ThreadPoolExecutor
+        def create(path):
+            if isinstance(path, os.DirEntry):
+                return cls.from_direntry(path, accessmode=accessmode)
+            return cls(path, accessmode=accessmode)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(create, paths))
+
+    @classmethod
+    def from_direntry(cls, entry, accessmode='r'):
+        """Create an AudioFile object from an `os.DirEntry` of an audio file,
+        as yielded by `os.scandir`.
+
+        The file status that the directory entry caches is used, so that the
+        file does not have to be stat-ed again when it has been already, as
+        is the case on Windows, where it is obtained from the directory scan.
+
+        Parameters
+        ----------
+        entry: os.DirEntry
+        accessmode: {'r', 'r+'}, default: 'r'
+
+        Returns
+        -------
+        AudioFile object
+
+        """
+        stat = None
+        if entry.is_file() and \
+                not entry.name.lower().endswith(SndInfo._suffix.lower()):
+            stat = entry.stat()
+        return cls(entry.path, accessmode=accessmode, stat=stat)
+
+    @classmethod
+    def read_header(cls, path):
+        """Read the header information of an audio file, without creating
+        an AudioFile object.
+
+        This is cheaper than instantiating an AudioFile when only the size
+        and format of audio files are needed, e.g. when scanning many files.
+        Note that any information in an accompanying sndinfo file, such as
+        an overriding sampling rate, is not taken into account.
+
+        Parameters
+        ----------
+        path: str or pathlib.Path
+
+        Returns
+        -------
+        dict with keys 'nframes', 'nchannels', 'fs', 'fileformat',
+        'encoding' and 'endianness'
+
+        """
+        audiofilepath, _ = cls._check_path(path)
+        stat = os.stat(audiofilepath)
+        header = dict(_read_header(str(audiofilepath), stat.st_size,
+                                   stat.st_mtime_ns))
+        header.pop('dataoffset', None)
+        return header
 
     def __str__(self):
         return f'{super().__str__()[:-1]}, {self.fileformat} ' \
@@ -184,12 +634,35 @@ class AudioFile(BaseSnd, SndInfo):
     def endianness(self):
         return self._endianness
 
-    def _check_path(self, path):
+    @property
+    def filesize(self):
+        """Size of the audio file in bytes, as it was when last stat'ed."""
+        return self._stat.st_size
+
+    @property
+    def filemtime(self):
+        """Last modification time of the audio file in seconds since the
+        epoch, as it was when last stat'ed."""
+        return self._stat.st_mtime
+
+    def refresh_stat(self):
+        """Stat the audio file again, e.g. after it has been modified.
+
+        The result of `os.stat` is cached at instantiation so that file
+        size and modification time can be obtained without additional system
+        calls.
+
+        """
+        self._stat = os.stat(self._audiofilepath)
+
+    @staticmethod
+    def _check_path(path):
         path = Path(path)
-        if path.suffix.upper()[1:] in availableaudioformats:
+        kind = _suffixkind(path.suffix)
+        if kind == 'audio':
             sndinfopath = Path(f'{path}{SndInfo._suffix}')
             audiopath = path
-        elif path.suffix in (SndInfo._suffix, SndInfo._suffix.upper()):  # we received info file, not audio file
+        elif kind == 'info':  # we received info file, not audio file
             sndinfopath = path
             audiopath = path.parent / path.stem
         elif not path.exists():
@@ -198,26 +671,159 @@ class AudioFile(BaseSnd, SndInfo):
             raise IOError(f"file {path} not recognized as an audio file")
         return audiopath, sndinfopath
 
+    def _ensure_open(self):
+        """Returns the file handle that is kept open by this object, or
+        otherwise a handle from the cache of open file handles, which is
+        opened if it is not in the cache already."""
+        if self._fileobj is not None:
+            return self._fileobj
+        return _get_cachedfilehandle(self._audiofilepathstr, self._mode,
+                                     self._stat)
+
     @contextmanager
-    def _openfile(self, mode=None):
-        if mode is None:
-            mode = self._mode
+    def open(self):
         if self._fileobj is not None:
-            yield self._fileobj
+            yield None
         else:
+            import soundfile as sf
             try:
-                with sf.SoundFile(str(self.audiofilepath), mode=mode) as fileobj:
+                with sf.SoundFile(self._audiofilepathstr,
+                                  mode=self._mode) as fileobj:
                     self._fileobj = fileobj
-                    yield fileobj
-            except:
-                raise
+                    _fileobjpositions[fileobj] = 0
+                    yield None
             finally:
                 self._fileobj = None
 
-    @contextmanager
-    def open(self):
-        with self._openfile():
-            yield None
+    def _get_mmap(self):
+        if self._mmap is None:
+            if self._audioencoding == 'PCM_24':
+                # Each 24-bit sample is read as part of an unaligned int32
+                # that starts one byte before it. The extra byte belongs to
+                # the previous sample (or to the chunk header). It is the
+                # lowest byte for little-endian data, which is masked out
+                # with _pcm24mask, and the highest byte for big-endian data,
+                # which is shifted out. Both yield the int32 values of
+                # libsndfile; see `_convert_mmapframes`.
+                nbytes = self._nframes * self._nchannels * 3
+                mapped = _memmap(self._audiofilepathstr, dtype='u1',
+                                 offset=self._mmapoffset - 1,
+                                 shape=(nbytes + 1,),
+                                 accesspattern=self._accesspattern)
+                self._mmap = as_strided(mapped[:4].view(self._mmapdtype),
+                                        shape=(self._nframes,
+                                               self._nchannels),
+                                        strides=(self._nchannels * 3, 3),
+                                        writeable=False)
+            else:
+                mapped = _memmap(self._audiofilepathstr, dtype=self._mmapdtype,
+                                 offset=self._mmapoffset,
+                                 shape=(self._nframes, self._nchannels),
+                                 accesspattern=self._accesspattern)
+                # a plain ndarray view is much faster to slice than a memmap
+                self._mmap = np.asarray(mapped)
+            # the mmap object itself and the file position at which it
+            # starts, for `prefetch`
+            self._rawmmap = getattr(mapped, '_mmap', None)
+            self._rawmmapstart = mapped.offset - \
+                                 mapped.offset % mmap.ALLOCATIONGRANULARITY
+        return self._mmap
+
+    @wraptimeparamsmethod
+    def prefetch(self, startframe=None, endframe=None, starttime=None,
+                 endtime=None, startdatetime=None, enddatetime=None):
+        """Advise the operating system to start loading frames into memory
+        in the background.
+
+        This is useful when reading successive blocks of frames that are
+        processed one by one: the next block can then be read from disk while
+        the current one is being processed. It has no effect for files that
+        are not memory-mapped, or on platforms that do not support it.
+
+        Parameters
+        ----------
+        startframe
+        endframe
+        starttime
+        endtime
+        startdatetime
+        enddatetime
+
+        """
+        if self._mmapoffset is None or startframe == endframe or \
+                not hasattr(mmap, 'MADV_WILLNEED'):
+            return
+        self._get_mmap()
+        if self._rawmmap is None:
+            return
+        samplewidth = 3 if self._audioencoding == 'PCM_24' \
+            else self._mmapdtype.itemsize
+        framesize = self._nchannels * samplewidth
+        start = self._mmapoffset + startframe * framesize - self._rawmmapstart
+        end = self._mmapoffset + endframe * framesize - self._rawmmapstart
+        start -= start % mmap.PAGESIZE # madvise needs page-aligned ranges
+        self._rawmmap.madvise(mmap.MADV_WILLNEED, start, end - start)
+
+    def _convert_mmapframes(self, frames, out=None):
+        """Converts memory-mapped frames that cannot be returned as they are
+        to frames with dtype `framesdtype`."""
+        if self._audioencoding == 'PCM_24':
+            if self._mmapdtype.str[0] == '>':
+                return np.left_shift(frames, 8, out=out)
+            return np.bitwise_and(frames, _pcm24mask, out=out)
+        if self._audioencoding in _bytetables:
+            return np.take(_bytetables[self._audioencoding], frames, out=out,
+                           mode='clip')
+        if out is None:
+            return frames.astype(self._npframesdtype)
+        np.copyto(out, frames)
+        return out
+
+    def _normalize_pcm24(self, frames, factor, out):
+        """Normalizes memory-mapped PCM_24 frames into `out`.
+
+        This is done in tiles that fit in cache, so that the intermediate
+        int32 frames do not have to make a round trip to main memory before
+        they are converted to float.
+
+        """
+        tileframes = _tilesamples
+        if frames.ndim == 2:
+            tileframes = max(1, tileframes // frames.shape[1])
+        scratch = np.empty((min(tileframes, len(frames)),) + frames.shape[1:],
+                           dtype=np.int32)
+        for i in range(0, len(frames), tileframes):
+            tile = frames[i:i + tileframes]
+            tile = self._convert_mmapframes(tile, out=scratch[:len(tile)])
+            np.multiply(tile, factor, out=out[i:i + tileframes],
+                        dtype=out.dtype)
+        return out
+
+    def close(self):
+        """Close the audio file handle if it is kept open, and release the
+        memory map of the frames if there is one."""
+        if self._fileobj is not None:
+            self._fileobj.close()
+            self._fileobj = None
+        self._mmap = None
+        self._rawmmap = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __del__(self):
+        fileobj = getattr(self, '_fileobj', None)
+        if fileobj is not None:
+            fileobj.close()
+
+    @staticmethod
+    def close_all_handles():
+        """Close all audio file handles that are kept open in the cache
+        that is used for reading outside of an `open` context."""
+        close_cachedfilehandles()
 
     def set_mode(self, mode):
         if not mode in {'r', 'r+'}:
@@ -227,12 +833,12 @@ class AudioFile(BaseSnd, SndInfo):
     @wraptimeparamsmethod
     def read_frames(self, startframe=None, endframe=None, starttime=None,
                     endtime=None, startdatetime=None, enddatetime=None,
-                    channelindex=None, out=None,
-                    normalizeaudio=False):
+                    channelindex=None, out=None, dtype=None,
+                    normalizeaudio=False, copy=True):
         """Read audio frames (timesamples, channels) from file.
 
-        A frames is a time sample that may be multichannel. The dtype cannot be chosen,
-        and will be the closest compatible to the encoding type. Encodings based on integer
+        A frames is a time sample that may be multichannel. By default, the dtype
+        will be the closest compatible to the encoding type. Encodings based on integer
         numbers (e.g. PCM_16) will return int16 or int32 types (depending on bit depth
         of encoding), FLOAT encoding float32 and DOUBLE float64.
 
@@ -244,58 +850,226 @@ class AudioFile(BaseSnd, SndInfo):
         endtime
         startdatetime
         enddatetime
-        channelindex
-        out
+        channelindex: {None, int, slice, sequence of ints}, default: None
+            Selects channels. An int selects one channel, which returns a 1D
+            array of frames; e.g. for mono files use 0 to obtain 1D frames
+            (without extra copying) instead of frames with shape
+            (nframes, 1).
+        out: {None, numpy ndarray}, default: None
+            Array with shape (nframes, nchannels) into which frames are read,
+            so that no new array needs to be allocated. This is useful when
+            reading successive blocks of frames; see `make_read_buffer`. Its
+            dtype should be `framesdtype`, or a float dtype when normalizing.
+            The frames that are returned are a view of `out`, which is shorter
+            than `out` if fewer frames were read.
+        dtype: {None, numpy dtype}, default: None
+            The dtype of the frames that are returned. If None, this is
+            `framesdtype`, or, if `normalizeaudio` is True, float32 for
+            encodings of up to 24 bits (which float32 represents exactly)
+            and float64 otherwise. When normalizing, it should be a float
+            dtype.
         normalizeaudio: bool, default: False
-            Determines whether or not integer audio encodings such as PCM_16 should be normalized
+            Determines whether or not integer audio encodings such as PCM_16
+            should be normalized. Normalization is equivalent to dividing
+            int16 data by 0x8000 and int32 data by 0x80000000, as libsndfile
+            does. For WAV files that are memory-mapped it is combined with
+            `scalingfactor` into a single multiplication.
+        copy: bool, default: True
+            If False, frames of memory-mapped files that do not need
+            conversion (little-endian PCM_16, PCM_32, FLOAT and DOUBLE WAV
+            files) are returned as a read-only view of the memory map, rather
+            than as a copy. This is faster, but the view keeps the file mapped
+            for as long as it exists, also after `close`.
 
         Returns
         -------
+        numpy ndarray
 
         """
 
-        with self._openfile() as af:
-            if startframe != af.tell():
-                try:
-                    af.seek(startframe)
-                except:
-                    #TODO make a proper error
-                    print(f'Unexpected error when seeking frame {startframe} in {self.audiofilepath} '
-                          f'which should have {self.nframes} frames.')
-                    raise
+        if self._mmapisview and out is None and dtype is None and \
+                channelindex is None and not normalizeaudio and \
+                self._scalingfactor is None:
+            # the most common case, plain frames of a memory-mapped file,
+            # without going through the general machinery below
+            frames = self._get_mmap()[startframe:endframe]
+            return frames.copy() if copy else frames
+
+        if normalizeaudio:
+            if self._normalizationfactor is None:
+                raise TypeError(f"'normalizeaudio' parameter is "
+                                f"True, but can only be applied to int16 and "
+                                f"int32 data; received {self._framesdtype} "
+                                f"data.")
+            if dtype is None:
+                dtype = self._normdtype
+            readdtype = dtype if out is None else out.dtype
+            if np.dtype(readdtype).kind != 'f':
+                raise TypeError(f"normalized frames can only be read as "
+                                f"float data, not as {readdtype}")
+        else:
+            readdtype = self._npframesdtype
+            if out is not None and out.dtype != readdtype:
+                raise TypeError(f"'out' should have dtype {readdtype}, not "
+                                f"{out.dtype}")
+        scaled = False
+        if startframe == endframe:
+            # nothing to read, so do not touch the file at all
+            if out is None:
+                frames = np.empty((0, self._nchannels), dtype=readdtype)
+            else:
+                frames = out[:0]
+        elif self._mmapoffset is not None and normalizeaudio:
+            # normalization and scaling are folded into one factor, so that
+            # the frames are converted to float in a single pass
+            frames = self._get_mmap()[startframe:endframe]
+            factor = self._normalizationfactor
+            if self.scalingfactor is not None:
+                factor *= self.scalingfactor
+                scaled = True
+            if out is None:
+                if channelindex is not None:
+                    frames = frames[:, channelindex]
+                    channelindex = None
+                normframes = np.empty(frames.shape, dtype=readdtype)
+            else:
+                n = min(len(frames), len(out))
+                frames = frames[:n]
+                normframes = out[:n]
+            if self._audioencoding == 'PCM_24':
+                frames = self._normalize_pcm24(frames, factor, normframes)
+            elif self._audioencoding in _bytetables:
+                # decode and normalize in one lookup
+                table = np.multiply(_bytetables[self._audioencoding], factor,
+                                    dtype=readdtype)
+                frames = np.take(table, frames, out=normframes, mode='clip')
+            else:
+                frames = np.multiply(frames, factor, out=normframes,
+                                     dtype=readdtype)
+        elif self._mmapoffset is not None:
+            frames = self._get_mmap()[startframe:endframe]
+            if not self._mmapisview:
+                if out is None:
+                    if channelindex is not None:
+                        frames = frames[:, channelindex]
+                        channelindex = None
+                    frames = self._convert_mmapframes(frames)
+                else:
+                    n = min(len(frames), len(out))
+                    frames = self._convert_mmapframes(frames[:n],
+                                                      out=out[:n])
+            elif out is not None:
+                n = min(len(frames), len(out))
+                np.copyto(out[:n], frames[:n])
+                frames = out[:n]
+        elif self._fileobj is None and startframe == 0 and \
+                endframe == self._nframes:
+            # Whole-file reads are done in one go, without seeking, and
+            # without using (and thereby evicting) a cached file handle.
+            import soundfile as sf
+            frames, _ = sf.read(self._audiofilepathstr, dtype=readdtype,
+                                always_2d=True, out=out)
+        else:
+            af = self._ensure_open()
+            # startframe and endframe have been checked against nframes
+            # already, so errors here are unexpected
             try:
-                frames = af.read(endframe - startframe, dtype=self._framesdtype,
+                if startframe != _fileobjpositions.get(af):
+                    af.seek(startframe)
+                frames = af.read(endframe - startframe, dtype=readdtype,
                                  always_2d=True, out=out)
-            except:
-                # TODO make a proper error
-                print(f'Unexpected error when reading {endframe-startframe} frames, '
-                      f'starting from frame {startframe} in {self.audiofilepath}, which should '
-                      f'have {self.nframes} frames.')
-                raise
-
-            if channelindex is not None:
-                frames = frames[:,channelindex]
-            if normalizeaudio: # 'int32', 'int16'
-                if frames.dtype == np.int32:
-                    normfactor = 0x80000000
-                elif frames.dtype == np.int16:
-                    normfactor = 0x8000
-                else:
-                    raise TypeError(f"'normalizeaudio' parameter is "
-                                    f"True, but can only be applied to int16 and "
-                                    f"int32 data; received {frames.dtype} "
-                                    f"data.")
-                frames = frames.astype('float64')
-                frames /= normfactor
-            if self.scalingfactor is not None:
+            except Exception as e:
+                _fileobjpositions.pop(af, None)
+                raise IOError(f'could not read frames {startframe} to '
+                              f'{endframe} from {self.audiofilepath}, which '
+                              f'should have {self.nframes} frames') from e
+            _fileobjpositions[af] = startframe + len(frames)
+        if channelindex is not None:
+            frames = frames[:,channelindex]
+            if out is None and frames.flags.writeable:
+                # Frames that were decoded into a new array are copied to a
+                # contiguous one, which is faster to process further and
+                # releases the memory of the channels that were not selected.
+                frames = np.ascontiguousarray(frames)
+        if not normalizeaudio and dtype is not None:
+            dtype = np.dtype(dtype)
+            if dtype.kind == 'f' and frames.dtype != dtype and \
+                    self.scalingfactor is not None and \
+                    self.scalingfactor != 1:
+                # cast and scale in one pass
+                frames = np.multiply(frames, dtype.type(self.scalingfactor),
+                                     dtype=dtype)
+                scaled = True
+            else:
+                frames = frames.astype(dtype, copy=False)
+        if self.scalingfactor is not None and not scaled:
+            if frames.dtype.kind != 'f':
                 frames = frames * self.scalingfactor
-            return frames
+            elif self.scalingfactor != 1:
+                # (an identity scaling of float frames is skipped, as it would
+                # only cost a pass over memory)
+                # a scalar of the same dtype keeps e.g. float32 frames float32
+                scalingfactor = frames.dtype.type(self.scalingfactor)
+                # frames that are not a read-only view of the memory-mapped
+                # file are ours (or 'out'), so they can be scaled in place
+                if frames.flags.writeable:
+                    np.multiply(frames, scalingfactor, out=frames)
+                else:
+                    frames = frames * scalingfactor
+        if copy and not frames.flags.writeable:
+            # a view of the memory-mapped file
+            frames = frames.copy()
+        return frames
+
+    def make_read_buffer(self, nframes, dtype=None):
+        """Returns an empty array that can be used repeatedly as `out`
+        parameter of `read_frames`.
+
+        Parameters
+        ----------
+        nframes: int
+            Number of frames that fit in the buffer.
+        dtype: {None, numpy dtype}, default: None
+            Defaults to `framesdtype`. Use a float dtype for reading normalized
+            frames.
+
+        Returns
+        -------
+        numpy ndarray
+
+        """
+        if dtype is None:
+            dtype = self._framesdtype
+        return np.empty((nframes, self._nchannels), dtype=dtype)
+
+    def _iterread_kwargs(self, blocklen, dtype, normalizeaudio):
+        # Frames of memory-mapped files that are not normalized are read as
+        # views of the memory map, which is cheaper than copying them into
+        # a buffer.
+        if self._mmapisview and not normalizeaudio:
+            return {'copy': False}
+        if normalizeaudio:
+            return {'out': self.make_read_buffer(
+                blocklen, dtype=dtype or self._normdtype)}
+        return {'out': self.make_read_buffer(blocklen)}
 
     def info(self, verbose=False):
-        d = super().info()
-        d['fileformat'] = self.fileformat
-        d['audiofilepath'] = str(self.audiofilepath)
-        return {k: d[k] for k in sorted(d.keys())}
+        """Returns a dictionary with information on the sound.
+
+        The dictionary is created once and then cached until one of the
+        parameters is changed. A (shallow) copy is returned.
+
+        """
+        if self._infocache is None:
+            d = super().info()
+            d['fileformat'] = self.fileformat
+            d['audiofilepath'] = self._audiofilepathstr
+            self._infocache = {k: d[k] for k in sorted(d.keys())}
+        return dict(self._infocache)
+
+    def _set_parameter(self, parameter, value, infoparameters):
+        self._infocache = None
+        SndInfo._set_parameter(self, parameter, value, infoparameters)
 
     def as_audiosnd(self, accessmode='r', overwrite=False):
         """Convert an AudioFile to an AudioSnd
@@ -333,9 +1107,10 @@ class AudioSnd(AudioFile, SndInfo):
 
     def __init__(self, path, accessmode='r'):
         path = Path(path)
-        if path.suffix.upper()[1:] in availableaudioformats: # we received audio file, not info file
+        kind = _suffixkind(path.suffix)
+        if kind == 'audio': # we received audio file, not info file
             sndinfopath = Path(f'{path}{SndInfo._suffix}')
-        elif path.suffix in (SndInfo._suffix, SndInfo._suffix.upper()):
+        elif kind == 'info':
             sndinfopath = path
         else:
             raise IOError(f"file {path} does not exist")
@@ -359,45 +1134,60 @@ class AudioSnd(AudioFile, SndInfo):
         return {k: d[k] for k in sorted(d.keys())}
 
 
+@lru_cache(maxsize=None)
+def _audiocompatibility():
+    """Returns a frozenset with all (format, encoding) pairs that libsndfile
+    can write."""
+    import soundfile as sf
+    return frozenset((f, e) for f in _availableaudioformats()
+                     for e in _availableaudioencodings()
+                     if sf.check_format(f, e))
+
 def audiocompatibilitytable_rst():
     """Creates a table with info on compatibility between audio formats and
     encodings.
 
-    To be used for creating documentation.
+    To be used for creating documentation. Default encodings are marked as
+    they are in `defaultaudioencoding` at the time of the call.
 
     Returns
     -------
     str
 
     """
-    maxaenckeylen = max(len(k) for k in _audioencodingkeys)
-    sl = [] # stringlist
-    # first line, horizontal border of table
-    sl.append('+' + ((maxaenckeylen + 2) * '-') + '+')
-    for formatkey in _audioformatkeys:
-        sl.append(((len(formatkey) + 2) * '-') + '+')
-    sl.append('\n')
-    hborder = "".join(sl) # we need it after header row
+    availableaudioformats = _availableaudioformats()
+    availableaudioencodings = _availableaudioencodings()
+    audioformatkeys = tuple(availableaudioformats.keys())
+    audioencodingkeys = tuple(availableaudioencodings.keys())
+    compatible = _audiocompatibility()
+    # formats without a default encoding (e.g. newer ones such as MP3) are
+    # simply not marked with a D
+    defaults = set(defaultaudioencoding.items())
+    maxaenckeylen = max(len(k) for k in audioencodingkeys)
+    # horizontal border of table
+    hborder = f"+{'':-<{maxaenckeylen + 2}}+" + \
+              ''.join(f"{'':-<{len(k) + 2}}+" for k in audioformatkeys) + '\n'
+    sl = [hborder] # stringlist
     # header row
-    sl.append(f'| ' + (maxaenckeylen * ' ') + ' |')
-    for formatkey in _audioformatkeys:
-        sl.append(f' {formatkey} |')
-    sl.append(f"\n{hborder.replace('-','=')}")
+    sl.append(f"| {'':<{maxaenckeylen}} |" +
+              ''.join(f' {k} |' for k in audioformatkeys) +
+              f"\n{hborder.replace('-','=')}")
+    # the three possible cells in the column of each format
+    formatcells = {k: {mark: f' {mark:<{len(k)}} |' for mark in ' DY'}
+                   for k in audioformatkeys}
     # next rows
-    for enckey in _audioencodingkeys:
-        # row label
-        sl.append(f'| {enckey}' + ((maxaenckeylen - len(enckey)) * ' ') + ' |')
-        # cols
-        for formatkey in _audioformatkeys:
-            if sf.check_format(formatkey, enckey):
-                r = ' Y ' + ((len(formatkey) - 1) * ' ') + '|'
+    for enckey in audioencodingkeys:
+        cells = []
+        for formatkey in audioformatkeys:
+            if (formatkey, enckey) not in compatible:
+                mark = ' '
+            elif (formatkey, enckey) in defaults:
+                mark = 'D'
             else:
-                r = ((len(formatkey) + 1 ) * ' ') + ' |'
-            if enckey == defaultaudioencoding[formatkey]:
-                r = r.replace('Y', 'D')
-            sl.append(r)
-        sl.append('\n')
-        sl.append(hborder)
+                mark = 'Y'
+            cells.append(formatcells[formatkey][mark])
+        sl.append(f'| {enckey:<{maxaenckeylen}} |' + ''.join(cells) + '\n' +
+                  hborder)
     sl.append("\nFormats: ")
     sl.extend([f'**{k}**: {l}, ' for k,l in availableaudioformats.items()])
     sl.append("\nEncodings: ")
@@ -56,8 +56,6 @@ def list_audiofiles(audiodir, extensions=None,
         'endianness': [],
     }
     for path in paths:
-        (mode, ino, dev, nlink, uid, gid, size, atime, mtime, ctime) = os.stat(
-            path)
         if path.suffix in ('.darrsnd','.DARRSND'):
             snd = DarrSnd(path)
         elif path.suffix in ('.audiosnd','.AUDIOSND'):
@@ -145,16 +145,16 @@ class BaseSnd:
 
     @property
     def startepochtime(self):
-        if str(self.startdatetime) == "NaT":
+        if np.isnat(self._startdatetime):
             return None
         else:
-            return (np.datetime64(self.startdatetime) -
+            return (self._startdatetime -
                     np.datetime64('1970-01-01T00:00:00')) / \
                    np.timedelta64(1, 's')
 
     @property
     def endepochtime(self):
-        if str(self.startdatetime) == "NaT":
+        if np.isnat(self._startdatetime):
             return None
         else:
             return self.startepochtime + self.duration
@@ -232,8 +232,10 @@ class BaseSnd:
         if not self.unit == other.unit:
             return False
         blocklen = int(self.fs)
-        for i,j in zip(self.iterread_frames(blocklen=blocklen),
-                       other.iterread_frames(blocklen=blocklen)):
+        # blocks are compared and then discarded, so they can be read into
+        # reused buffers
+        for i,j in zip(self.iterread_frames(blocklen=blocklen, copy=False),
+                       other.iterread_frames(blocklen=blocklen, copy=False)):
             if not (i==j).all():
                 return False
         return True
@@ -258,8 +260,10 @@ class BaseSnd:
         if ('nchannels' not in d) and ('nframes' not in d):
             blocklen = int(self.fs)
             nframesdifferent = 0
-            for i,j in zip(self.iterread_frames(blocklen=blocklen),
-                           other.iterread_frames(blocklen=blocklen)):
+            for i,j in zip(self.iterread_frames(blocklen=blocklen,
+                                                copy=False),
+                           other.iterread_frames(blocklen=blocklen,
+                                                 copy=False)):
                 nframesdifferent += (i!=j).sum()
             if nframesdifferent > 0:
                 d['nframesdifferent'] = nframesdifferent
@@ -433,7 +437,7 @@ class BaseSnd:
     def frameindex_to_datetime(self, frameindex, where='start'):
         sndtime = self.frameindex_to_sndtime(frameindex=frameindex,
                                              where=where)
-        if str(self.startdatetime) == "NaT":
+        if np.isnat(self._startdatetime):
             return np.datetime64('NaT')
         else:
             return self.startdatetime + \
@@ -441,7 +445,7 @@ class BaseSnd:
 
     # fixme origin time?
     def sndtime_to_datetime(self, time):
-        if str(self.startdatetime) == "NaT":
+        if np.isnat(self._startdatetime):
             return None
         else:
             time = np.round(np.asanyarray(time) * 1e9).astype(
@@ -461,13 +465,25 @@ class BaseSnd:
     def open(self):
         yield None
 
+    def _iterread_kwargs(self, blocklen, dtype, normalizeaudio):
+        # Subclasses can return extra read_frames keyword arguments here that
+        # iterread_frames uses when it does not need to copy blocks, e.g. an
+        # 'out' array that is reused for successive blocks.
+        return {}
+
     @wraptimeparamsmethod
     def iterread_frames(self, blocklen=44100, stepsize=None,
                         include_remainder=True, startframe=None, endframe=None,
                         starttime=None, endtime=None, startdatetime=None,
                         enddatetime=None, channelindex=None,
                         firstblocklen=None,
-                        dtype=None, normalizeaudio=False):
+                        dtype=None, normalizeaudio=False, copy=True):
+        # If copy is False, blocks may be read into one buffer that is reused
+        # for each block, or be read-only views of the underlying data, so
+        # that a block is only valid until the next one.
+        readkwargs = {}
+        if not copy:
+            readkwargs = self._iterread_kwargs(blocklen, dtype, normalizeaudio)
         with self.open():
             if firstblocklen is not None:
                 if firstblocklen > endframe:
@@ -489,7 +505,8 @@ class BaseSnd:
                                        endframe=windowend,
                                        channelindex=channelindex,
                                        dtype=dtype,
-                                       normalizeaudio=normalizeaudio)
+                                       normalizeaudio=normalizeaudio,
+                                       **readkwargs)
 
     @wraptimeparamsmethod
     def read(self, startframe=None, endframe=None, starttime=None,
@@ -527,7 +544,7 @@ class BaseSnd:
                 raise ValueError(f'`splitonclockhour` parameter not '
                                  f'compatible with `blocklen` {blocklen} that'
                                  f'does not correspond to one hour')
-            if self.startdatetime == np.datetime64('NaT'):
+            if np.isnat(self._startdatetime):
                 raise ValueError(f'`splitonclockhour` parameter not possible '
                                  f'when there is no known sound startdatetime')
             firstblocklen = int(round(calcsecstonexthour(self.startdatetime) * self.fs))
@@ -544,11 +561,14 @@ class BaseSnd:
                                            channelindex=channelindex,
                                            firstblocklen=firstblocklen,
                                            dtype=dtype,
-                                           normalizeaudio=normalizeaudio):
+                                           normalizeaudio=normalizeaudio,
+                                           # windows that are copied below
+                                           # can be read into one buffer
+                                           copy=not copy):
             if copy:
                 window = window.copy()
             elapsedsec = (nread + startframe) * self.dt
-            if str(self.startdatetime) == 'NaT':
+            if np.isnat(self._startdatetime):
                 startdatetime = 'NaT'
             else:
                 startdatetime = self.startdatetime + \
@@ -627,20 +647,29 @@ class BaseSnd:
         if path.exists() and not overwrite:
             raise IOError(
                 "File '{}' already exists; use 'overwrite'".format(path))
-        if channelindex is not None:
-            nchannels = len(np.ones([1, self.nchannels])[0, channelindex])
-        else:
+        if channelindex is None:
             nchannels = self.nchannels
+        elif isinstance(channelindex, (int, np.integer)):
+            nchannels = 1 # frames are read as 1D
+        elif isinstance(channelindex, slice):
+            nchannels = len(range(*channelindex.indices(self.nchannels)))
+        elif np.asarray(channelindex).dtype == bool: # channel mask
+            nchannels = np.count_nonzero(channelindex)
+        else:
+            nchannels = len(channelindex)
         startdatetime = self.frameindex_to_datetime(startframe,
                                                     where='start')
         origintime = self.origintime - startframe / float(self.fs)
         with sf.SoundFile(file=str(path), mode='w', samplerate=samplerate,
                           channels=nchannels, subtype=encoding, endian=endian,
                           format=format) as f:
+            # each block is written before the next is read, so blocks can
+            # be read into one reused buffer
             for window in self.iterread_frames(blocklen=samplerate,
-                                            startframe=startframe,
-                                            endframe=endframe,
-                                            channelindex=channelindex):
+                                               startframe=startframe,
+                                               endframe=endframe,
+                                               channelindex=channelindex,
+                                               copy=False):
                 f.write(window)
             endian = f.endian
         info = self._saveparams
@@ -875,19 +904,34 @@ class Snd(BaseSnd):
         if channelindex is None:
             channelindex = slice(None,None,None)
         frames = self._frames[slice(startframe, endframe), channelindex]
-        frames = np.array(frames, copy=True, dtype=dtype, order=order,
-                          ndmin=ndmin)
         if normalizeaudio:  # 'int32', 'int16'
+            # as in AudioFile, int16 frames are normalized to float32 by
+            # default, which represents them exactly
             if frames.dtype == np.int32:
-                frames *= 1 / 0x80000000
+                factor = 1 / 0x80000000
+                normdtype = 'float64'
             elif frames.dtype == np.int16:
-                frames *= 1 / 0x8000
+                factor = 1 / 0x8000
+                normdtype = 'float32'
             else:
                 raise TypeError(f"'normalizeaudio' parameter is "
                                 f"True, but can only applied to int16 and "
                                 f"int32 data; received {frames.dtype} "
                                 f"data.")
-        if self.scalingfactor is not None:
+            if self.scalingfactor is not None:
+                factor *= self.scalingfactor
+            # normalization and scaling in one pass, which also makes the
+            # (float) copy
+            frames = np.multiply(frames, factor,
+                                 dtype=normdtype if dtype is None else dtype)
+            frames = np.asarray(frames, order=order)
+            if frames.ndim < ndmin:
+                frames = frames.reshape((1,) * (ndmin - frames.ndim) +
+                                        frames.shape)
+            return frames
+        frames = np.array(frames, copy=True, dtype=dtype, order=order,
+                          ndmin=ndmin)
+        if self.scalingfactor is not None and self.scalingfactor != 1:
             frames *= self.scalingfactor
 
         return frames
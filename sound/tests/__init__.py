@@ -1,10 +1,11 @@
 from unittest import TestLoader, TextTestRunner, TestSuite
 
+from . import test_audiofile
 from . import test_basesnd
 from . import test_snd
 
 
-modules = [test_basesnd, test_snd]
+modules = [test_audiofile, test_basesnd, test_snd]
 
 def test(verbosity=1):
     suite =TestSuite()
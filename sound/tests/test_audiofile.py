@@ -0,0 +1,175 @@
+import unittest
+import numpy as np
+from pathlib import Path
+from sound.audiofile import AudioFile, _read_wavheader
+from sound.utils import tempdir
+
+
+def write_testfile(path, fileformat='WAV', encoding='PCM_16', nchannels=2,
+                   nframes=1000, fs=8000):
+    import soundfile as sf
+    frames = np.linspace(-0.9, 0.9, nframes * nchannels).reshape(nframes,
+                                                                 nchannels)
+    sf.write(str(path), frames, fs, subtype=encoding, format=fileformat)
+    with sf.SoundFile(str(path)) as f:
+        return f.read(dtype=AudioFile(path).framesdtype, always_2d=True)
+
+
+class TestAudioFile(unittest.TestCase):
+
+    def test_readframes(self):
+        for encoding in ('PCM_U8', 'PCM_16', 'PCM_24', 'PCM_32', 'FLOAT',
+                         'DOUBLE', 'ULAW', 'ALAW'):
+            with tempdir() as dirname:
+                path = Path(dirname) / f'test_{encoding}.wav'
+                ref = write_testfile(path, encoding=encoding)
+                af = AudioFile(path)
+                frames = af.read_frames(startframe=10, endframe=500)
+                self.assertEqual(frames.dtype, ref.dtype)
+                self.assertTrue(np.array_equal(frames, ref[10:500]))
+                frames = af.read_frames(channelindex=1)
+                self.assertTrue(np.array_equal(frames, ref[:, 1]))
+                af.close()
+
+    def test_readframescopy(self):
+        for encoding in ('PCM_16', 'FLOAT'):
+            with tempdir() as dirname:
+                path = Path(dirname) / f'test_{encoding}.wav'
+                ref = write_testfile(path, encoding=encoding)
+                af = AudioFile(path)
+                for channelindex in (None, 1):
+                    frames = af.read_frames(channelindex=channelindex)
+                    self.assertTrue(frames.flags.writeable)
+                    frames *= 2 # does not affect the file
+                view = af.read_frames(copy=False)
+                self.assertFalse(view.flags.writeable)
+                self.assertTrue(np.array_equal(view, ref))
+                frames = af.read().read_frames()
+                self.assertFalse(np.shares_memory(frames, view))
+                af.close()
+
+    def test_readframesnormalized(self):
+        for encoding in ('PCM_U8', 'PCM_16', 'PCM_24', 'PCM_32'):
+            with tempdir() as dirname:
+                path = Path(dirname) / f'test_{encoding}.wav'
+                ref = write_testfile(path, encoding=encoding)
+                normfactor = 0x8000 if ref.dtype == np.int16 else 0x80000000
+                af = AudioFile(path)
+                self.assertIsNotNone(af._mmapoffset) # memory-mapped
+                frames = af.read_frames(normalizeaudio=True)
+                if encoding == 'PCM_32':
+                    self.assertEqual(frames.dtype, np.float64)
+                else:
+                    self.assertEqual(frames.dtype, np.float32)
+                self.assertTrue(np.array_equal(frames, ref / normfactor))
+                frames = af.read_frames(normalizeaudio=True, dtype='float64')
+                self.assertEqual(frames.dtype, np.float64)
+                self.assertTrue(np.array_equal(frames, ref / normfactor))
+                af.close()
+
+    def test_readframesnonwav(self):
+        with tempdir() as dirname:
+            path = Path(dirname) / 'test.flac'
+            ref = write_testfile(path, fileformat='FLAC', encoding='PCM_16')
+            af = AudioFile(path)
+            self.assertTrue(np.array_equal(af.read_frames(), ref))
+            af.close()
+            header = AudioFile.read_header(path)
+            self.assertEqual(header['nframes'], 1000)
+            self.assertEqual(header['nchannels'], 2)
+            self.assertEqual(header['fs'], 8000)
+            self.assertEqual(header['fileformat'], 'FLAC')
+
+    def test_readframesaiff(self):
+        for encoding in ('PCM_16', 'PCM_24', 'PCM_32'):
+            with tempdir() as dirname:
+                path = Path(dirname) / f'test_{encoding}.aiff'
+                ref = write_testfile(path, fileformat='AIFF',
+                                     encoding=encoding)
+                af = AudioFile(path)
+                frames = af.read_frames(startframe=10, endframe=500)
+                self.assertEqual(frames.dtype, ref.dtype)
+                self.assertTrue(np.array_equal(frames, ref[10:500]))
+                af.close()
+
+    def test_readframesout(self):
+        for encoding in ('PCM_16', 'PCM_24'):
+            with tempdir() as dirname:
+                path = Path(dirname) / f'test_{encoding}.wav'
+                ref = write_testfile(path, encoding=encoding)
+                af = AudioFile(path)
+                buffer = af.make_read_buffer(300)
+                for start in range(0, af.nframes, 300):
+                    end = min(start + 300, af.nframes)
+                    frames = af.read_frames(startframe=start, endframe=end,
+                                            out=buffer)
+                    self.assertTrue(np.shares_memory(frames, buffer))
+                    self.assertTrue(np.array_equal(frames, ref[start:end]))
+                af.close()
+
+    def test_prefetch(self):
+        for encoding in ('PCM_16', 'PCM_24', 'FLOAT'):
+            with tempdir() as dirname:
+                path = Path(dirname) / f'test_{encoding}.wav'
+                ref = write_testfile(path, encoding=encoding, nframes=10000)
+                af = AudioFile(path)
+                for start in range(0, af.nframes, 3000):
+                    end = min(start + 3000, af.nframes)
+                    af.prefetch(startframe=start, endframe=end)
+                    frames = af.read_frames(startframe=start, endframe=end)
+                    self.assertTrue(np.array_equal(frames, ref[start:end]))
+                af.close()
+
+    def test_accesspattern(self):
+        with tempdir() as dirname:
+            path = Path(dirname) / 'test.wav'
+            ref = write_testfile(path)
+            for accesspattern in (None, 'sequential', 'random'):
+                af = AudioFile(path, accesspattern=accesspattern)
+                self.assertTrue(np.array_equal(af.read_frames(), ref))
+                af.close()
+            self.assertRaises(ValueError, AudioFile, path,
+                              accesspattern='backwards')
+
+    def test_contextmanager(self):
+        with tempdir() as dirname:
+            path = Path(dirname) / 'test.wav'
+            ref = write_testfile(path)
+            with AudioFile(path, keepopen=True) as af:
+                self.assertTrue(np.array_equal(af.read_frames(), ref))
+            self.assertIsNone(af._fileobj)
+            self.assertIsNone(af._mmap)
+
+    def test_toaudiofilechannelindex(self):
+        with tempdir() as dirname:
+            path = Path(dirname) / 'test.wav'
+            ref = write_testfile(path, nchannels=4)
+            af = AudioFile(path)
+            for i, channelindex in enumerate((2, slice(1, None, 2), [0, 3, 2],
+                                              np.array([True, False, True,
+                                                        False]))):
+                newaf = af.to_audiofile(Path(dirname) / f'test{i}.wav',
+                                        channelindex=channelindex,
+                                        encoding='PCM_16')
+                frames = ref[:, channelindex].reshape(af.nframes, -1)
+                self.assertEqual(newaf.nchannels, frames.shape[1])
+                self.assertTrue(np.array_equal(newaf.read_frames(), frames))
+                newaf.close()
+            af.close()
+
+    def test_wavheader(self):
+        import soundfile as sf
+        for fileformat in ('WAV', 'WAVEX'):
+            for encoding in ('PCM_U8', 'PCM_16', 'PCM_24', 'PCM_32', 'FLOAT',
+                             'DOUBLE', 'ULAW', 'ALAW'):
+                with tempdir() as dirname:
+                    path = Path(dirname) / 'test.wav'
+                    write_testfile(path, fileformat=fileformat,
+                                   encoding=encoding, nchannels=3)
+                    header = _read_wavheader(path, path.stat().st_size)
+                    with sf.SoundFile(str(path)) as f:
+                        self.assertEqual(header['nframes'], len(f))
+                        self.assertEqual(header['nchannels'], f.channels)
+                        self.assertEqual(header['fs'], f.samplerate)
+                        self.assertEqual(header['fileformat'], f.format)
+                        self.assertEqual(header['encoding'], f.subtype)
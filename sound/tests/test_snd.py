@@ -50,9 +50,12 @@ class TestSnd(unittest.TestCase):
         snd = Snd(frames=frames, fs=10)
         self.assertEqual(snd.nframes, 2)
 
-
-
-
-
-
-
+    def test_normalizeaudio(self):
+        frames = np.array([[0, 1], [2, 3], [4, 5]], dtype='int16') * 1000
+        snd = Snd(frames=frames, fs=10)
+        normframes = snd.read_frames(normalizeaudio=True)
+        self.assertEqual(normframes.dtype, np.float32)
+        self.assertTrue((normframes == frames / 0x8000).all())
+        normframes = snd.read_frames(normalizeaudio=True, dtype='float64')
+        self.assertEqual(normframes.dtype, np.float64)
+        self.assertTrue((normframes == frames / 0x8000).all())
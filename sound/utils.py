@@ -365,13 +365,12 @@ def read_json(path):
 
 def calcsecstonexthour(datetime):
     datetime = np.datetime64(datetime)
-    D, T = str(datetime).split('T')
-    h, m, s = T.split(':')
-    if (float(m) != 0.0) or (float(s) != 0.0):
-        td =  np.datetime64(f'{D}T{int(h) + 1:02d}:00:00') - np.datetime64(f'{D}T{h}:{m}:{s}')
-        return td.item().total_seconds()
-    else:
+    hour = datetime.astype('datetime64[h]') # floors to the whole hour
+    if hour == datetime:
         return 0.0
+    else:
+        td = (hour + np.timedelta64(1, 'h')) - datetime
+        return float(td / np.timedelta64(1, 's'))
 
 def peek_iterable(iterable):
     gen = (i for i in iterable)